@@ -16,6 +16,9 @@ from PySide6.QtCore import QDateTime, QTime, QDate, QTimeZone
 import pandas as pd
 import numpy as np
 
+MSECS_PER_DAY = 86400000
+UNIX_EPOCH_JULIAN_DAY = 2440588
+
 
 def convert_date_to_milliseconds(date):
     """
@@ -26,6 +29,43 @@ def convert_date_to_milliseconds(date):
     return QDateTime(date, QTime(), QTimeZone.utc()).toMSecsSinceEpoch()
 
 
+def convert_dates_to_milliseconds(dates):
+    """
+    Converts a sequence of dates to milliseconds since epoch.
+
+    Parameters:
+        dates (Sequence[QDate]): Sequence of QDate objects, None entries are allowed.
+
+    Returns:
+        numpy.ndarray: float64 array of milliseconds since epoch, NaN where the date is None.
+    """
+    julian_days = np.fromiter((np.nan if date is None else date.toJulianDay() for date in dates),
+                              dtype=np.float64, count=len(dates))
+    return (julian_days - UNIX_EPOCH_JULIAN_DAY) * MSECS_PER_DAY
+
+
+def numpy_datetime64_to_milliseconds(numpy_datetimes):
+    """
+    Convert an array of NumPy datetime64 values to milliseconds since epoch at local midnight of each date.
+
+    The result is the same as QDateTime(numpy_datetime64_to_qdate(d), QTime()).toMSecsSinceEpoch() for each value d.
+    The offset from UTC can change between dates because of daylight saving time, so local midnight is looked up
+    once for each distinct date and then spread back over the array.
+
+    Parameters:
+        numpy_datetimes (numpy.ndarray): Array of NumPy datetime64 values.
+
+    Returns:
+        numpy.ndarray: int64 array of milliseconds since epoch.
+    """
+    days = np.asarray(numpy_datetimes).astype('datetime64[D]')
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    local_midnights = np.fromiter((QDateTime(QDate(day.year, day.month, day.day), QTime()).toMSecsSinceEpoch()
+                                   for day in unique_days.astype(object)),
+                                  dtype=np.int64, count=len(unique_days))
+    return local_midnights[inverse.reshape(days.shape)]
+
+
 def pandas_date_to_qdate(pandas_date):
     """
     Convert a pandas Timestamp or datetime object to a PySide2 QDate object.
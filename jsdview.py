@@ -13,18 +13,23 @@
 #      limitations under the License.
 #
 
-from typing import Type, Union, List, Tuple
+from typing import Type, Union, List, Tuple, Dict
 import math, io, csv
-from PySide6.QtCore import (QRect, Qt, QDateTime, QTime, QPointF, QSignalBlocker, Signal,
-                            QFileInfo, QEvent, QDate)
-from PySide6.QtGui import QPainter, QAction, QKeySequence, QGuiApplication
+from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
+from PySide6.QtCore import (QRect, Qt, QDateTime, QPointF, QSignalBlocker, Signal,
+                            QFileInfo, QDate, QModelIndex)
+from PySide6.QtGui import (QPainter, QAction, QKeySequence, QGuiApplication, QStandardItemModel, QStandardItem,
+                           QOpenGLContext, QShortcut)
 from PySide6.QtWidgets import (QHeaderView, QTableView, QWidget, QMainWindow, QGroupBox, QMenu, QFileDialog,
                                QVBoxLayout, QComboBox, QLabel, QHBoxLayout, QMenuBar, QDockWidget, QSplitter,
                                QLayout, QFormLayout, QGridLayout, QLineEdit, QDialog, QDialogButtonBox, QSpinBox,
                                QCheckBox)
 from PySide6.QtCharts import (QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis,
-                              QPieSeries, QPolarChart, QAreaSeries, QCategoryAxis)
-from datetimetools import numpy_datetime64_to_qdate, convert_date_to_milliseconds
+                              QPieSeries, QPieSlice, QPolarChart, QAreaSeries, QCategoryAxis)
+from datetimetools import convert_dates_to_milliseconds, numpy_datetime64_to_milliseconds
+from numerictools import cumulative_percents
 
 
 class JsdDataSelectionGroupBox(QGroupBox):
@@ -39,6 +44,7 @@ class JsdDataSelectionGroupBox(QGroupBox):
         num_data_items_changed (Signal): A signal emitted when the number of data items in the JsdDataSelectionGroupBox
                                          changes.
         NUM_DEFAULT_DATA_ITEMS (int): The default number of data items.
+        file_count (int): The number of files that can be selected in the file comboboxes.
 
     Methods:
         __init__(self, data_sources): Initializes the JsdDataSelectionGroupBox object.
@@ -66,6 +72,8 @@ class JsdDataSelectionGroupBox(QGroupBox):
         self.setTitle('Data Selection')
 
         self.form_layout = QFormLayout()
+        # All file comboboxes share a single model, so a file only needs to be added once
+        self._file_model = QStandardItemModel(self)
         self.file_comboboxes = []
         self.file_checkboxes = []
         self.category_label = QLabel('Attribute')
@@ -101,21 +109,32 @@ class JsdDataSelectionGroupBox(QGroupBox):
         self.file_comboboxes[0].setCurrentIndex(0)
         self.file_checkboxes[0].setChecked(True)
 
-        # Now we can copy the data from the first combobox to the rest of them
+        # Now we can add the rest of the comboboxes, which share the model of the first one
         self.set_num_data_items(self.NUM_DEFAULT_DATA_ITEMS)
 
+    @property
+    def file_count(self) -> int:
+        """
+        Get the number of files that can be selected in the file comboboxes.
+
+        Returns:
+        int: The number of files.
+        """
+        return self._file_model.rowCount()
+
     def add_file_combobox_to_layout(self, auto_populate: bool = True):
         """
         Add a file combobox to the layout.
 
         Parameters:
-        - auto_populate (bool): If True, the combobox will be populated with items from the first combobox.
+        - auto_populate (bool): If True, the combobox will select the file matching its position in the layout.
 
         Returns:
         None
         """
         new_hbox = QHBoxLayout()
         new_combobox = QComboBox()
+        new_combobox.setModel(self._file_model)
         new_checkbox = QCheckBox()
         new_hbox.addWidget(new_combobox, stretch=1)
         new_hbox.addWidget(new_checkbox, stretch=0)
@@ -129,9 +148,6 @@ class JsdDataSelectionGroupBox(QGroupBox):
         new_checkbox.toggled.connect(self.file_checkbox_state_changed.emit)
 
         if auto_populate:
-            cbox: QComboBox = self.file_comboboxes[0]
-            for i in range(cbox.count()):
-                new_combobox.addItem(cbox.itemText(i), userData=cbox.itemData(i))
             new_combobox.setCurrentIndex(index - 1)
 
     def remove_file_combobox_from_layout(self):
@@ -163,6 +179,7 @@ class JsdDataSelectionGroupBox(QGroupBox):
           using the add_file_combobox_to_layout method.
         * If the current number of file comboboxes is greater than the count, the method removes file comboboxes from
           the layout using the remove_file_combobox_from_layout method.
+        * The rows are added or removed with updates disabled, and the layout is activated once afterwards.
         * Finally, the method emits the num_data_items_changed signal with the updated count.
 
         Parameters:
@@ -173,17 +190,23 @@ class JsdDataSelectionGroupBox(QGroupBox):
         """
         if len(self.file_comboboxes) == count:
             return
-        while len(self.file_comboboxes) < count:
-            self.add_file_combobox_to_layout()
-        while len(self.file_comboboxes) > count:
-            self.remove_file_combobox_from_layout()
+        # Add or remove all the rows before laying out and repainting the group box
+        self.setUpdatesEnabled(False)
+        try:
+            while len(self.file_comboboxes) < count:
+                self.add_file_combobox_to_layout()
+            while len(self.file_comboboxes) > count:
+                self.remove_file_combobox_from_layout()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.form_layout.activate()
         self.num_data_items_changed.emit(count)
 
     def add_file_to_comboboxes(self, description: str, name: str):
         """
         Add a file to the file comboboxes.
 
-        This method adds a file to each of the file comboboxes in the JsdDataSelectionGroupBox.
+        This method adds a file to the model shared by all of the file comboboxes in the JsdDataSelectionGroupBox.
         The file is represented by a description and a name.
         The description is displayed in the combobox as the item text, and the name is stored as the item data.
 
@@ -194,8 +217,9 @@ class JsdDataSelectionGroupBox(QGroupBox):
         Returns:
         None
         """
-        for combobox in self.file_comboboxes:
-            combobox.addItem(description, userData=name)
+        item = QStandardItem(description)
+        item.setData(name, Qt.UserRole)
+        self._file_model.appendRow(item)
 
     def update_category_combo_box(self, categorylist, categoryindex):
         """
@@ -248,7 +272,9 @@ class JsdWindow(QMainWindow):
 
         self.jsd_timeline_chart = JsdChart()
         self.jsd_timeline_chart_view = QChartView(self.jsd_timeline_chart)
-        self.jsd_timeline_chart_view.setRenderHint(QPainter.Antialiasing)
+        # Antialiasing is off by default since it is slow to draw for dense series, the 'Chart Antialiasing' setting
+        # turns it back on
+        self.jsd_timeline_chart_view.setRenderHint(QPainter.Antialiasing, False)
         # self.jsd_timeline_chart_view.setMinimumSize(640, 480)
 
         self.setCentralWidget(QWidget())
@@ -258,6 +284,8 @@ class JsdWindow(QMainWindow):
 
         self.pie_chart_views = {}
         self.pie_chart_hbox_labels = {}
+        self._pie_chart_view_pool: Dict[Tuple[int, int], QChartView] = {}
+        self._pie_chart_label_pool: Dict[int, QLabel] = {}
         self.pie_chart_grid = QGridLayout()
         self.pie_chart_dock_widget = self.create_dock_widget(self.pie_chart_grid,
                                                              'Pie Charts - ' + JsdWindow.WINDOW_TITLE)
@@ -268,11 +296,18 @@ class JsdWindow(QMainWindow):
         # self.area_chart_layout = QVBoxLayout()
         self.area_chart_widget.setLayout(QVBoxLayout())
         self.area_charts = {}
+        self._area_chart_views: List[QChartView] = []
         self.spider_chart_vbox = QSplitter(Qt.Vertical)
         self.spider_chart_dock_widget = self.create_spider_chart_dock_widget(self.spider_chart_vbox,
                                                                          'Diversity Charts - ' + JsdWindow.WINDOW_TITLE)
         self.addDockWidget(Qt.RightDockWidgetArea, self.spider_chart_dock_widget)
 
+        self._file_options_dialog = None
+        self._last_excel_file_dir = ''
+        self._adjust_dialog = None
+        self._adjust_spinbox = None
+        self._last_date_range = None
+
         self.setWindowTitle(JsdWindow.WINDOW_TITLE)
 
     def create_main_layout(self) -> QVBoxLayout:
@@ -322,14 +357,21 @@ class JsdWindow(QMainWindow):
         # Create the 'Chart Animations' action
         chart_animation_setting: QAction = QAction("Chart Animations", self)
         chart_animation_setting.setCheckable(True)
-        chart_animation_setting.setChecked(True)
+        chart_animation_setting.setChecked(False)
         chart_animation_setting.toggled.connect(lambda checked: self.set_animation_options(checked))
 
+        # Create the 'Chart Antialiasing' action
+        chart_antialiasing_setting: QAction = QAction("Chart Antialiasing", self)
+        chart_antialiasing_setting.setCheckable(True)
+        chart_antialiasing_setting.setChecked(False)
+        chart_antialiasing_setting.toggled.connect(lambda checked: self.set_chart_antialiasing(checked))
+
         num_files_setting: QAction = QAction("Number of Files to Compare", self)
         num_files_setting.triggered.connect(self.adjust_number_of_files_to_compare)
 
         # Add the actions to the 'Settings' menu
         settings_menu.addAction(chart_animation_setting)
+        settings_menu.addAction(chart_antialiasing_setting)
         settings_menu.addAction(num_files_setting)
 
         # Return the menu bar
@@ -431,9 +473,8 @@ class JsdWindow(QMainWindow):
         Raises:
         - None
         """
-        # First, get rid of the old stuff just to be safe
+        # The labels and chart views from previous updates are reused, see the end of the method for hiding the extras
         # print('update pie chart dock')
-        clear_layout(self.pie_chart_grid)
         self.pie_chart_views = {}
         self.pie_chart_hbox_labels = {}
         # self.pie_chart_grid = QGridLayout()
@@ -443,6 +484,8 @@ class JsdWindow(QMainWindow):
         categories = [self.dataselectiongroupbox.category_combobox.itemText(i) for i in
                       range(self.dataselectiongroupbox.category_combobox.count())]
         # print('categories:', categories)
+        file_descriptions = [cbox.currentText() for cbox in
+                             self.dataselectiongroupbox.file_comboboxes[:len(sheet_list)]]
 
         # Set the timepoint to the last timepoint in the series for now
         timepoint = -1
@@ -450,28 +493,50 @@ class JsdWindow(QMainWindow):
         new_pie_chart_views = {}
         # print('len(sheet_list):', len(sheet_list))
         hbox_labels = {}
-        for i in range(len(sheet_list)):
-            sheets = sheet_list[i]
-            hbox_labels[i] = QLabel(self.dataselectiongroupbox.file_comboboxes[i].currentText() + ':')
-            self.pie_chart_grid.addWidget(hbox_labels[i], i, 0)
-            # print("Pie Chart row", i)
-            # print("File Being Used:", self.dataselectiongroupbox.file_comboboxes[i].currentText())
-            for j, category in enumerate(categories):
-                # print('category:', category)
-                chart = QChart()
-                new_pie_chart_views[(category, i)] = QChartView(chart)
-                chart.setTitle(category)
-                df = sheets[category].df
-                cols_to_use = sheets[category].data_columns
-                series = QPieSeries(chart)
-                for col in cols_to_use:
-                    if df[col].iloc[timepoint] > 0:
-                        series.append(col, df[col].iloc[timepoint])
-                chart.addSeries(series)
-                chart.legend().setAlignment(Qt.AlignRight)
-                self.pie_chart_grid.addWidget(new_pie_chart_views[(category, i)], i, j+1)
-                self.pie_chart_grid.setColumnStretch(j+1, 1)
-            self.pie_chart_grid.setRowStretch(i, 1)
+        # Hold off repainting the dock until all of the labels and charts have been added to the grid
+        self.pie_chart_dock_widget.setUpdatesEnabled(False)
+        try:
+            for i in range(len(sheet_list)):
+                sheets = sheet_list[i]
+                if i not in self._pie_chart_label_pool:
+                    self._pie_chart_label_pool[i] = QLabel()
+                    self.pie_chart_grid.addWidget(self._pie_chart_label_pool[i], i, 0)
+                hbox_labels[i] = self._pie_chart_label_pool[i]
+                hbox_labels[i].setText(file_descriptions[i] + ':')
+                # print("Pie Chart row", i)
+                # print("File Being Used:", file_descriptions[i])
+                for j, category in enumerate(categories):
+                    # print('category:', category)
+                    if (i, j) not in self._pie_chart_view_pool:
+                        self._pie_chart_view_pool[(i, j)] = QChartView(QChart())
+                        self.pie_chart_grid.addWidget(self._pie_chart_view_pool[(i, j)], i, j+1)
+                    new_pie_chart_views[(category, i)] = self._pie_chart_view_pool[(i, j)]
+                    chart = new_pie_chart_views[(category, i)].chart()
+                    df = sheets[category].df
+                    cols_to_use = sheets[category].data_columns
+                    values = df[cols_to_use].iloc[timepoint].to_numpy(dtype=np.float64)
+                    with _no_animations(chart):
+                        chart.removeAllSeries()
+                        chart.setTitle(category)
+                        series = QPieSeries(chart)
+                        series.append([QPieSlice(col, value) for col, value in zip(cols_to_use, values) if value > 0])
+                        chart.addSeries(series)
+                        chart.legend().setAlignment(Qt.AlignRight)
+                    self.pie_chart_grid.setColumnStretch(j+1, 1)
+                self.pie_chart_grid.setRowStretch(i, 1)
+
+            # Hide the pooled widgets that are not needed for the current files and categories
+            for i, label in self._pie_chart_label_pool.items():
+                label.setVisible(i < len(sheet_list))
+                if i >= len(sheet_list):
+                    self.pie_chart_grid.setRowStretch(i, 0)
+            for (i, j), pie_chart_view in self._pie_chart_view_pool.items():
+                pie_chart_view.setVisible(i < len(sheet_list) and j < len(categories))
+                if j >= len(categories):
+                    self.pie_chart_grid.setColumnStretch(j+1, 0)
+        finally:
+            self.pie_chart_dock_widget.setUpdatesEnabled(True)
+        self.pie_chart_dock_widget.updateGeometry()
 
         # self.pie_chart_hboxes = hbox
         self.pie_chart_views = new_pie_chart_views
@@ -496,36 +561,38 @@ class JsdWindow(QMainWindow):
         file1_data = self._dataselectiongroupbox.file_comboboxes[0].currentData()
         file2_data = self._dataselectiongroupbox.file_comboboxes[1].currentData()
 
-        self.spider_chart.removeAllSeries()
-        for axis in self.spider_chart.axes():
-            self.spider_chart.removeAxis(axis)
+        # Rebuild the chart without animations or intermediate change notifications
+        with QSignalBlocker(self.spider_chart), _no_animations(self.spider_chart):
+            self.spider_chart.removeAllSeries()
+            for axis in self.spider_chart.axes():
+                self.spider_chart.removeAxis(axis)
 
-        self.update_spider_chart_title(file1_data, file2_data)
+            self.update_spider_chart_title(file1_data, file2_data)
 
-        labels = spider_plot_values.keys()
-        series = QLineSeries()
-        angular_axis = QCategoryAxis()
-        angular_axis.setRange(0, 360)
-        angular_axis.setLabelsPosition(QCategoryAxis.AxisLabelsPositionOnValue)
+            labels = spider_plot_values.keys()
+            series = QLineSeries()
+            angular_axis = QCategoryAxis()
+            angular_axis.setRange(0, 360)
+            angular_axis.setLabelsPosition(QCategoryAxis.AxisLabelsPositionOnValue)
 
-        step_size = 360 / len(labels)
-        for index, label in enumerate(labels):
-            angle = step_size * index
-            series.append(angle, spider_plot_values[label])
-            angular_axis.append(label, angle)
+            step_size = 360 / len(labels)
+            for index, label in enumerate(labels):
+                angle = step_size * index
+                series.append(angle, spider_plot_values[label])
+                angular_axis.append(label, angle)
 
-        series.append(360, series.points()[0].y())
-        series.setName(f'{file1_data} vs {file2_data}')
+            series.append(360, series.points()[0].y())
+            series.setName(f'{file1_data} vs {file2_data}')
 
-        self.spider_chart.addSeries(series)
-        self.spider_chart.addAxis(angular_axis, QPolarChart.PolarOrientationAngular)
-        series.attachAxis(angular_axis)
+            self.spider_chart.addSeries(series)
+            self.spider_chart.addAxis(angular_axis, QPolarChart.PolarOrientationAngular)
+            series.attachAxis(angular_axis)
 
-        radial_axis = QValueAxis()
-        radial_axis.setRange(0, max(point.y() for point in series.points()))
-        radial_axis.setLabelFormat('%.2f')
-        self.spider_chart.addAxis(radial_axis, QPolarChart.PolarOrientationRadial)
-        series.attachAxis(radial_axis)
+            radial_axis = QValueAxis()
+            radial_axis.setRange(0, np.fromiter(spider_plot_values.values(), dtype=np.float64).max())
+            radial_axis.setLabelFormat('%.2f')
+            self.spider_chart.addAxis(radial_axis, QPolarChart.PolarOrientationRadial)
+            series.attachAxis(radial_axis)
 
         return True
 
@@ -556,61 +623,86 @@ class JsdWindow(QMainWindow):
         necessary data for the chart. After updating the chart, the method does not return any value.
         """
         category = self._dataselectiongroupbox.category_combobox.currentText()
-
-        clear_layout(self.area_chart_widget.layout())
+        filenames = [cbox.currentData() for cbox in self._dataselectiongroupbox.file_comboboxes[:len(sheet_list)]]
 
         self.area_charts = {}
 
-        for i in range(len(sheet_list)):
-            area_chart = QChart()
-            filename = self.dataselectiongroupbox.file_comboboxes[i].currentData()
-            area_chart.setTitle(f'{filename} {category} distribution over time')
-            sheets = sheet_list[i]
-
-            df = sheets[category].df
-            cols_to_use = sheets[category].data_columns
-            total_counts = df[cols_to_use].sum(axis=1)
-            upper_counts = df[cols_to_use].cumsum(axis=1)
-            upper_counts = upper_counts.apply(lambda x: 100.0 * x / total_counts)
-            dates = [QDateTime(numpy_datetime64_to_qdate(date), QTime()) for date in df.date.values]
-            lower_series = None
-            for index, col in enumerate(cols_to_use):
-                if df[col].iloc[-1] == 0:
-                    continue
-
-                points = [QPointF(dates[j].toMSecsSinceEpoch(), upper_counts.iloc[j][col]) for j in range(len(dates))]
-                if len(dates) == 1:
-                    points.append(QPointF(dates[0].toMSecsSinceEpoch() + 1, upper_counts.iloc[0][col]))
-
-                upper_series = QLineSeries(area_chart)
-                upper_series.append(points)
-
-                area = QAreaSeries(upper_series, lower_series)
-                area.setName(col)
-                area_chart.addSeries(area)
-                lower_series = upper_series
-
-            for axis in area_chart.axes():
-                area_chart.removeAxis(axis)
-            area_chart.createDefaultAxes()
-
-            area_chart.removeAxis(area_chart.axisX())
-            axis_x = QDateTimeAxis()
-            axis_x.setTickCount(10)
-            axis_x.setFormat("MMM yyyy")
-            axis_x.setTitleText("Date")
-            axis_x.setRange(dates[0], dates[-1] if len(dates) > 1 else dates[0].addMSecs(1))
-            area_chart.addAxis(axis_x, Qt.AlignBottom)
-
-            axis_y = area_chart.axisY()
-            axis_y.setTitleText("Percent of total")
-            axis_y.setLabelFormat('%.0f%')
-            axis_y.setRange(0, 100)
-            area_chart.setProperty("current_data", filename)
-
-            self.add_area_chart_view(area_chart)
-
-            self.area_charts[i] = area_chart
+        # Coalesce the axis and series changes of every chart into a single repaint of the area chart widget
+        self.area_chart_widget.setUpdatesEnabled(False)
+        try:
+            for i in range(len(sheet_list)):
+                # Reuse the chart views from the previous update where possible
+                if i < len(self._area_chart_views):
+                    area_chart_view = self._area_chart_views[i]
+                    area_chart = area_chart_view.chart()
+                    area_chart.removeAllSeries()
+                    # The line series bounding each area are children of the chart, not series of it
+                    for line_series in area_chart.findChildren(QLineSeries):
+                        line_series.deleteLater()
+                    area_chart_view.show()
+                else:
+                    area_chart = QChart()
+                    area_chart_view = self.add_area_chart_view(area_chart)
+                    self._area_chart_views.append(area_chart_view)
+                filename = filenames[i]
+                with _no_animations(area_chart):
+                    area_chart.setTitle(f'{filename} {category} distribution over time')
+                    sheets = sheet_list[i]
+
+                    df = sheets[category].df
+                    cols_to_use = sheets[category].data_columns
+                    counts = df[cols_to_use].to_numpy(dtype=np.float64)
+                    upper_counts = cumulative_percents(counts)
+                    dates = numpy_datetime64_to_milliseconds(df.date.values)
+                    date_list = dates.tolist()
+                    lower_series = None
+                    for index, col in enumerate(cols_to_use):
+                        if counts[-1, index] == 0:
+                            continue
+
+                        col_values = upper_counts[:, index].tolist()
+                        points = list(map(QPointF, date_list, col_values))
+                        if len(date_list) == 1:
+                            points.append(QPointF(date_list[0] + 1, col_values[0]))
+
+                        upper_series = QLineSeries(area_chart)
+                        upper_series.append(points)
+
+                        area = QAreaSeries(upper_series, lower_series)
+                        area.setName(col)
+                        area_chart.addSeries(area)
+                        lower_series = upper_series
+
+                    # The chart gives up ownership of a removed axis, so delete the old axes of a reused chart
+                    for axis in area_chart.axes():
+                        area_chart.removeAxis(axis)
+                        axis.deleteLater()
+                    area_chart.createDefaultAxes()
+
+                    default_axis_x = area_chart.axisX()
+                    area_chart.removeAxis(default_axis_x)
+                    default_axis_x.deleteLater()
+                    axis_x = QDateTimeAxis()
+                    axis_x.setTickCount(10)
+                    axis_x.setFormat("MMM yyyy")
+                    axis_x.setTitleText("Date")
+                    date_max = int(dates[-1]) if len(dates) > 1 else int(dates[0]) + 1
+                    axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(dates[0])),
+                                    QDateTime.fromMSecsSinceEpoch(date_max))
+                    area_chart.addAxis(axis_x, Qt.AlignBottom)
+
+                    axis_y = area_chart.axisY()
+                    axis_y.setTitleText("Percent of total")
+                    axis_y.setLabelFormat('%.0f%')
+                    axis_y.setRange(0, 100)
+                    area_chart.setProperty("current_data", filename)
+
+                self.area_charts[i] = area_chart
+
+            for area_chart_view in self._area_chart_views[len(sheet_list):]:
+                area_chart_view.hide()
+        finally:
+            self.area_chart_widget.setUpdatesEnabled(True)
 
         return True
 
@@ -627,31 +719,96 @@ class JsdWindow(QMainWindow):
         This method updates the table view's model with the provided JSD model, effectively updating the JSD timeline plot.
         """
         self.table_view.setModel(jsd_model)
-        self.jsd_timeline_chart.removeAllSeries()
+        self.jsd_timeline_chart_view.setUpdatesEnabled(False)
+        try:
+            with _no_animations(self.jsd_timeline_chart):
+                self._build_jsd_timeline_series(jsd_model)
+        finally:
+            self.jsd_timeline_chart_view.setUpdatesEnabled(True)
+
+        return True
+
+    def _build_jsd_timeline_series(self, jsd_model):
+        """
+        Update the series and axes of the JSD timeline chart from the given JSD model.
+
+        The existing series are updated in place when the number of series has not changed, otherwise the series and
+        the date axis are rebuilt.
+
+        Parameters:
+        - jsd_model (Type): The JSD model to build the series from.
+
+        Returns:
+        - None
+        """
         jsd_model.clear_color_mapping()
-        series_list = []
+        series_data = []
         date_min = math.inf
         date_max = -math.inf
 
         # Use every other column since there are dates in every other column
         for c, column_info in enumerate(jsd_model.column_infos):
             col = c * 2
-            series = QLineSeries()
-            series.setName(f"{column_info['file1']} vs "
-                           f"{column_info['file2']} "
-                           f"{column_info['category']} JSD")
             row_count = jsd_model.rowCount(jsd_model.createIndex(0, col))
-            for i in range(row_count):
-                time_point = convert_date_to_milliseconds(jsd_model.input_data[col][i])
-                if time_point is not None:
-                    series.append(time_point, jsd_model.input_data[col + 1][i])
-                    if i == 0 and time_point < date_min:
-                        date_min = time_point
-                    if i == row_count - 1 and time_point > date_max:
-                        date_max = time_point
+            time_points = convert_dates_to_milliseconds(jsd_model.input_data[col][:row_count])
+            jsd_values = np.asarray(jsd_model.input_data[col + 1][:row_count], dtype=np.float64)
+            valid = np.isfinite(time_points)
+            time_points = time_points[valid]
+            jsd_values = jsd_values[valid]
+            # Don't add a series to the chart if there is nothing to plot
+            if time_points.size == 0:
+                continue
+            # The dates are sorted, so the first and last dates are the range of this series
+            date_min = min(date_min, time_points[0])
+            date_max = max(date_max, time_points[-1])
+            # Collect the points first so the series only has to be updated once
+            points = list(map(QPointF, time_points.tolist(), jsd_values.tolist()))
+            name = f"{column_info['file1']} vs {column_info['file2']} {column_info['category']} JSD"
+            series_data.append((name, points, QRect(col, 0, 2, row_count)))
+
+        existing_series = self.jsd_timeline_chart.series()
+        if series_data and len(existing_series) == len(series_data):
+            # Same number of lines as before, so update the existing series and axes in place
+            for series, (name, points, rect) in zip(existing_series, series_data):
+                series.setName(name)
+                series.replace(points)
+                jsd_model.add_color_mapping(series.pen().color().name(), rect)
+            axis_x = self.jsd_timeline_chart.axisX()
+        else:
+            axis_x = self._rebuild_jsd_timeline_series(jsd_model, series_data)
+
+        if series_data:
+            # Only set the range of the date axis when it has changed since the last update
+            date_range = (int(date_min), int(date_max))
+            if date_range != self._last_date_range:
+                axis_x.setRange(QDateTime.fromMSecsSinceEpoch(date_range[0]),
+                                QDateTime.fromMSecsSinceEpoch(date_range[1]))
+                self._last_date_range = date_range
+
+    def _rebuild_jsd_timeline_series(self, jsd_model, series_data):
+        """
+        Replace the series and the date axis of the JSD timeline chart.
+
+        Parameters:
+        - jsd_model (Type): The JSD model to add the color mapping of each series to.
+        - series_data (list): A list of (name, points, rect) tuples, one for each series.
+
+        Returns:
+        - QDateTimeAxis: The new date axis of the chart.
+        """
+        self.jsd_timeline_chart.removeAllSeries()
+        # The new date axis does not have a range yet
+        self._last_date_range = None
+        series_list = []
+        for name, points, rect in series_data:
+            series = QLineSeries()
+            # Draw the line on the GPU when possible, the theme still assigns the pen color for the table color mapping
+            series.setUseOpenGL(_opengl_available())
+            series.setName(name)
+            series.append(points)
             series_list.append(series)
             self.jsd_timeline_chart.addSeries(series)
-            jsd_model.add_color_mapping(series.pen().color().name(), QRect(col, 0, 2, row_count))
+            jsd_model.add_color_mapping(series.pen().color().name(), rect)
 
         self.jsd_timeline_chart.removeAxis(self.jsd_timeline_chart.axisX())
         axis_x = QDateTimeAxis()
@@ -671,11 +828,8 @@ class JsdWindow(QMainWindow):
         for series in series_list:
             series.attachAxis(axis_x)
             series.attachAxis(axis_y)
-        axis_x.setRange(QDateTime.fromMSecsSinceEpoch(date_min), QDateTime.fromMSecsSinceEpoch(date_max))
-
-        self.jsd_timeline_chart_view.setChart(self.jsd_timeline_chart)
 
-        return True
+        return axis_x
 
     def set_animation_options(self, enable_animations: bool):
         """
@@ -684,10 +838,20 @@ class JsdWindow(QMainWindow):
         Args:
             enable_animations (bool): If True, enable all animations. If False, disable all animations.
         """
-        if enable_animations:
-            self.jsd_timeline_chart.setAnimationOptions(QChart.AllAnimations)
-        else:
-            self.jsd_timeline_chart.setAnimationOptions(QChart.NoAnimation)
+        animation_options = QChart.AllAnimations if enable_animations else QChart.NoAnimation
+        if self.jsd_timeline_chart.animationOptions() != animation_options:
+            self.jsd_timeline_chart.setAnimationOptions(animation_options)
+        return True
+
+    def set_chart_antialiasing(self, enable_antialiasing: bool):
+        """
+        Set antialiasing for the JSD timeline chart.
+
+        Args:
+            enable_antialiasing (bool): If True, draw the chart with antialiasing. If False, draw the chart without
+                                        antialiasing, which is faster for dense series.
+        """
+        self.jsd_timeline_chart_view.setRenderHint(QPainter.Antialiasing, enable_antialiasing)
         return True
 
     def open_excel_file(self):
@@ -709,8 +873,17 @@ class JsdWindow(QMainWindow):
         Raises:
         - None
         """
-        file_name, _ = QFileDialog.getOpenFileName(self, "Open Excel File", "", "Excel Files (*.xls *.xlsx)")
-        file_options_dialog = FileOptionsDialog(self, file_name)
+        # Start in the folder of the previously opened file rather than enumerating the default folder again
+        file_name, _ = QFileDialog.getOpenFileName(self, "Open Excel File", self._last_excel_file_dir,
+                                                   "Excel Files (*.xls *.xlsx)")
+        if file_name:
+            self._last_excel_file_dir = QFileInfo(file_name).absolutePath()
+        # The options dialog is created on first use and reused for every file after that
+        if self._file_options_dialog is None:
+            self._file_options_dialog = FileOptionsDialog(self, file_name)
+        else:
+            self._file_options_dialog.set_file_name(file_name)
+        file_options_dialog = self._file_options_dialog
         file_options_dialog.exec()
         data_source_dict = {'name': file_options_dialog.name_line_edit.text(),
                             'description': file_options_dialog.description_line_edit.text(),
@@ -737,26 +910,32 @@ class JsdWindow(QMainWindow):
         Raises:
         - None
         """
-        d = QDialog(self)
-        d.setLayout(QVBoxLayout())
-        f_l = QFormLayout()
-        d.layout().addLayout(f_l)
-
-        spinbox = QSpinBox()
-        # The spinbox range should be between 2 and the number of files opened
-        spinbox.setMinimum(2)
-        spinbox.setMaximum(self.dataselectiongroupbox.file_comboboxes[0].count())
+        # Build the dialog the first time it is needed, and only update the spinbox after that
+        if self._adjust_dialog is None:
+            d = QDialog(self)
+            d.setLayout(QVBoxLayout())
+            f_l = QFormLayout()
+            d.layout().addLayout(f_l)
+
+            spinbox = QSpinBox()
+
+            f_l.addRow(QLabel("Number of Files to Compare:"), spinbox)
+
+            button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            button_box.accepted.connect(d.accept)
+            button_box.rejected.connect(d.reject)
+            d.layout().addWidget(button_box)
+
+            d.resize(400, -1)
+            self._adjust_dialog = d
+            self._adjust_spinbox = spinbox
+
+        spinbox = self._adjust_spinbox
+        # The spinbox range should be between 2 and the number of files opened, set both ends every time since
+        # setMaximum() also lowers the minimum when it is given a smaller value
+        spinbox.setRange(2, self.dataselectiongroupbox.file_count)
         spinbox.setValue(len(self.dataselectiongroupbox.file_comboboxes))
-
-        f_l.addRow(QLabel("Number of Files to Compare:"), spinbox)
-
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(d.accept)
-        button_box.rejected.connect(d.reject)
-        d.layout().addWidget(button_box)
-
-        d.resize(400, -1)
-        if d.exec():
+        if self._adjust_dialog.exec():
             self.dataselectiongroupbox.set_num_data_items(spinbox.value())
 
     def set_default_widget_sizes(self):
@@ -812,10 +991,12 @@ class JsdChart (QChart):
     A custom chart class for JSD data visualization.
     """
 
-    def __init__(self, animation_options=QChart.AllAnimations):
+    def __init__(self, animation_options=QChart.NoAnimation):
         """
         Initializes a new instance of the JsdChart class.
 
+        Animations are disabled by default, they can be enabled from the 'Chart Animations' setting.
+
         Args:
             animation_options (QChart.AnimationOptions): The animation options for the chart.
         """
@@ -823,25 +1004,60 @@ class JsdChart (QChart):
         self.setAnimationOptions(animation_options)
 
 
-def clear_layout(layout):
+@lru_cache(maxsize=None)
+def _opengl_available() -> bool:
+    """
+    Check whether an OpenGL context can be created for drawing accelerated chart series.
+
+    Returns:
+        bool: True if OpenGL is available, False if the series should be drawn without acceleration.
+    """
+    return QOpenGLContext().create()
+
+
+def _tab_delimited_text(cells: List[str], column_count: int) -> str:
     """
-    Clears all widgets and layouts from the given layout.
+    Joins a flat, row-major list of cell strings into tab-delimited text, the same as csv.writer with a tab delimiter.
+
+    Only tables that csv.writer would quote go through csv.writer itself: tables with a cell that contains a tab, a
+    carriage return, a newline or a double quote, and single-column tables with an empty cell, since csv.writer writes
+    an empty cell that is the only cell of its row as "". Every other table is joined directly.
 
     Parameters:
-        layout (QLayout): The layout to be cleared.
+        cells (List[str]): The cell strings, column_count cells per row.
+        column_count (int): The number of cells in each row.
 
     Returns:
-        None
+        str: The rows of the table, each terminated with '\\r\\n' like csv.writer does.
+    """
+    rows = range(0, len(cells), column_count)
+    joined_cells = ''.join(cells)
+    needs_quoting = column_count == 1 and '' in cells
+    if needs_quoting or any(special in joined_cells for special in ('\t', '\r', '\n', '"')):
+        # Let the csv module quote the cells
+        stream = io.StringIO()
+        csv.writer(stream, delimiter='\t').writerows(cells[r:r + column_count] for r in rows)
+        return stream.getvalue()
+    # Use the same line terminator as csv.writer
+    return ''.join('\t'.join(cells[r:r + column_count]) + '\r\n' for r in rows)
+
+
+@contextmanager
+def _no_animations(chart: QChart):
+    """
+    Context manager that disables the animations of a chart while it is being rebuilt.
+
+    The previous animation options of the chart are restored on exit.
 
+    Parameters:
+        chart (QChart): The chart to disable the animations for.
     """
-    if layout is not None:
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget() is not None:
-                child.widget().deleteLater()
-            elif child.layout() is not None:
-                clear_layout(child.layout())
-            layout.removeItem(child)
+    animation_options = chart.animationOptions()
+    chart.setAnimationOptions(QChart.NoAnimation)
+    try:
+        yield chart
+    finally:
+        chart.setAnimationOptions(animation_options)
 
 
 class FileOptionsDialog (QDialog):
@@ -857,6 +1073,7 @@ class FileOptionsDialog (QDialog):
 
     Methods:
         __init__(self, parent, file_name: str): Initializes the FileOptionsDialog object.
+        set_file_name(self, file_name: str): Resets the dialog fields for the given file.
     """
     def __init__(self, parent, file_name: str):
         """
@@ -886,10 +1103,7 @@ class FileOptionsDialog (QDialog):
 
         self.layout().addLayout(form_layout)
 
-        fi = QFileInfo(file_name)
-        self.setWindowTitle(fi.fileName())
-        self.name_line_edit.setText(fi.baseName())
-        self.description_line_edit.setText(fi.baseName())
+        self.set_file_name(file_name)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
         button_box.accepted.connect(self.accept)
@@ -897,6 +1111,24 @@ class FileOptionsDialog (QDialog):
 
         self.resize(600, -1)
 
+    def set_file_name(self, file_name: str):
+        """
+        Reset the dialog fields for the given file.
+
+        This allows the same dialog to be reused for every file that is opened.
+
+        Parameters:
+        - file_name (str): The name of the file for which the options are being displayed.
+
+        Returns:
+        None
+        """
+        fi = QFileInfo(file_name)
+        self.setWindowTitle(fi.fileName())
+        self.name_line_edit.setText(fi.baseName())
+        self.description_line_edit.setText(fi.baseName())
+        self.remove_column_text_line_edit.clear()
+
 
 class CopyableTableView(QTableView):
     """
@@ -907,30 +1139,15 @@ class CopyableTableView(QTableView):
 
     Methods:
         __init__(): Initializes the CopyableTableView object.
-        eventFilter(source, event): Filters and handles key press events.
         copy_selection(): Copies the selected data to the clipboard.
 
     """
     def __init__(self):
         super().__init__()
-        self.installEventFilter(self)
-
-    def eventFilter(self, source, event):
-        """
-        Filters and handles key press events.
-
-        Parameters:
-            source (object): The source object that triggered the event.
-            event (QEvent): The event object that contains information about the key press event.
-
-        Returns:
-            bool: True if the event is handled, False otherwise.
-        """
-        if event.type() == QEvent.KeyPress:
-            if event == QKeySequence.Copy:
-                self.copy_selection()
-                return True
-        return super(QTableView, self).eventFilter(source, event)
+        # Use a shortcut for the copy key sequence rather than filtering every event the view receives
+        copy_shortcut = QShortcut(QKeySequence.Copy, self)
+        copy_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        copy_shortcut.activated.connect(self.copy_selection)
 
     def copy_selection(self):
         """
@@ -942,21 +1159,96 @@ class CopyableTableView(QTableView):
         Raises:
             None
         """
-        copied = ''
         selection = self.selectedIndexes()
         if selection:
-            rows = sorted(index.row() for index in selection)
-            columns = sorted(index.column() for index in selection)
-            rowcount = rows[-1] - rows[0] + 1
-            colcount = columns[-1] - columns[0] + 1
-            table = [[''] * colcount for _ in range(rowcount)]
+            bounds = self._selection_bounds(selection)
+            table = self._selection_table(selection, bounds)
+            self._format_dates(table)
+            cells = ['' if value is None else str(value) for value in table]
+            QGuiApplication.clipboard().setText(_tab_delimited_text(cells, bounds.width()))
+
+    @staticmethod
+    def _selection_bounds(selection) -> QRect:
+        """
+        Finds the bounding rectangle of the selection in a single pass.
+
+        Parameters:
+            selection (List[QModelIndex]): The selected indexes, there must be at least one.
+
+        Returns:
+            QRect: The rectangle with the selected columns as x and the selected rows as y.
+        """
+        # Bind the QModelIndex getters once instead of looking them up for every cell
+        get_row = QModelIndex.row
+        get_column = QModelIndex.column
+        rmin = rmax = get_row(selection[0])
+        cmin = cmax = get_column(selection[0])
+        for index in selection:
+            r = get_row(index)
+            c = get_column(index)
+            if r < rmin:
+                rmin = r
+            elif r > rmax:
+                rmax = r
+            if c < cmin:
+                cmin = c
+            elif c > cmax:
+                cmax = c
+        return QRect(cmin, rmin, cmax - cmin + 1, rmax - rmin + 1)
+
+    def _selection_table(self, selection, bounds: QRect) -> list:
+        """
+        Collects the data of the selection into one flat, row-major list covering the bounding rectangle.
+
+        Cells inside the rectangle that are not selected are empty strings.
+
+        Parameters:
+            selection (List[QModelIndex]): The selected indexes.
+            bounds (QRect): The bounding rectangle of the selection.
+
+        Returns:
+            list: The data of each cell, rowcount * colcount items long.
+        """
+        rmin, cmin = bounds.top(), bounds.left()
+        rowcount, colcount = bounds.height(), bounds.width()
+        table = [''] * (rowcount * colcount)
+        input_data = getattr(self.model(), 'input_data', None)
+        if input_data is not None and len(selection) == rowcount * colcount:
+            # The selection is a full rectangle, so copy each column slice straight from the model's data
+            for column in range(colcount):
+                column_data = input_data[cmin + column][rmin:rmin + rowcount]
+                column_data.extend([None] * (rowcount - len(column_data)))
+                table[column::colcount] = column_data
+        else:
+            get_row = QModelIndex.row
+            get_column = QModelIndex.column
+            get_data = QModelIndex.data
             for index in selection:
-                row = index.row() - rows[0]
-                column = index.column() - columns[0]
-                index_data = index.data()
-                if isinstance(index_data, QDate):
-                    index_data = index_data.toString(format=Qt.ISODate)
-                table[row][column] = index_data
-            stream = io.StringIO()
-            csv.writer(stream, delimiter='\t').writerows(table)
-            QGuiApplication.clipboard().setText(stream.getvalue())
+                table[(get_row(index) - rmin) * colcount + get_column(index) - cmin] = get_data(index)
+        return table
+
+    @staticmethod
+    def _format_dates(table: list):
+        """
+        Replaces the QDate values in the table with ISO 8601 date strings, formatting each distinct date only once.
+
+        Parameters:
+            table (list): The cell values, modified in place.
+
+        Returns:
+            None
+        """
+        date_cache = {}
+        for i, value in enumerate(table):
+            if isinstance(value, QDate):
+                key = value.toJulianDay()
+                date_string = date_cache.get(key)
+                if date_string is None:
+                    # Build the ISO 8601 date directly, toString(format=Qt.ISODate) gives an empty string for
+                    # invalid dates and for years outside 0 to 9999
+                    if value.isValid() and 0 <= value.year() <= 9999:
+                        date_string = f"{value.year():04d}-{value.month():02d}-{value.day():02d}"
+                    else:
+                        date_string = ''
+                    date_cache[key] = date_string
+                table[i] = date_string
@@ -0,0 +1,65 @@
+#  Copyright (c) 2024 Medical Imaging and Data Resource Center (MIDRC).
+#
+#      Licensed under the Apache License, Version 2.0 (the "License");
+#      you may not use this file except in compliance with the License.
+#      You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#      Unless required by applicable law or agreed to in writing, software
+#      distributed under the License is distributed on an "AS IS" BASIS,
+#      WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#      See the License for the specific language governing permissions and
+#      limitations under the License.
+
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _cumulative_percents_kernel(counts):
+    """
+    Computes the cumulative percentages of each row of a 2D float64 array with explicit loops.
+
+    This is the kernel compiled with numba when it is available.
+    """
+    out = np.empty_like(counts)
+    for i in range(counts.shape[0]):
+        total = 0.0
+        for j in range(counts.shape[1]):
+            total += counts[i, j]
+        if total == 0.0:
+            total = 1.0
+        accumulated = 0.0
+        for j in range(counts.shape[1]):
+            accumulated += counts[i, j]
+            out[i, j] = 100.0 * accumulated / total
+    return out
+
+
+if njit is not None:
+    _cumulative_percents_jit = njit(cache=True)(_cumulative_percents_kernel)
+else:
+    _cumulative_percents_jit = None
+
+
+def cumulative_percents(counts):
+    """
+    Computes the cumulative sum along each row as a percentage of the row total.
+
+    Rows with a total of zero give zero for every column. numba is used to compile the computation when it is
+    installed, otherwise NumPy is used.
+
+    Parameters:
+        counts (numpy.ndarray): 2D array of counts, one row per date and one column per category value.
+
+    Returns:
+        numpy.ndarray: float64 array with the same shape as counts.
+    """
+    counts = np.ascontiguousarray(counts, dtype=np.float64)
+    if _cumulative_percents_jit is not None:
+        return _cumulative_percents_jit(counts)
+    totals = counts.sum(axis=1, keepdims=True)
+    return 100.0 * np.cumsum(counts, axis=1) / np.where(totals == 0, 1, totals)
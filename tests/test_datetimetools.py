@@ -1,8 +1,10 @@
-from PySide6.QtCore import QDateTime, QDate
-from datetimetools import convert_date_to_milliseconds, pandas_date_to_qdate, numpy_datetime64_to_qdate
+from PySide6.QtCore import QDateTime, QDate, QTime
+from datetimetools import (convert_date_to_milliseconds, convert_dates_to_milliseconds, pandas_date_to_qdate,
+                           numpy_datetime64_to_qdate, numpy_datetime64_to_milliseconds)
 import numpy as np
 import pandas as pd
 import pytest
+import time
 
 
 class TestConvertDateToMilliseconds:
@@ -104,6 +106,92 @@ class TestConvertDateToMilliseconds:
         assert result == 253370764800000
 
 
+class TestConvertDatesToMilliseconds:
+
+    #  The function returns the same values as convert_date_to_milliseconds for each date.
+    def test_matches_scalar_conversion(self):
+        # Arrange
+        dates = [QDate(1, 1, 1), QDate(2022, 1, 1), QDate(9999, 12, 31)]
+
+        # Act
+        result = convert_dates_to_milliseconds(dates)
+
+        # Assert
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [convert_date_to_milliseconds(date) for date in dates]
+
+    #  The function returns NaN for None entries.
+    def test_none_input(self):
+        # Arrange
+        dates = [QDate(2022, 1, 1), None]
+
+        # Act
+        result = convert_dates_to_milliseconds(dates)
+
+        # Assert
+        assert result[0] == 1640995200000
+        assert np.isnan(result[1])
+
+    #  The function returns an empty array for an empty input.
+    def test_empty_input(self):
+        # Arrange
+        dates = []
+
+        # Act
+        result = convert_dates_to_milliseconds(dates)
+
+        # Assert
+        assert result.size == 0
+
+
+class TestNumpyDatetime64ToMilliseconds:
+
+    #  Run these tests in a time zone that is not UTC and has daylight saving time
+    @pytest.fixture(autouse=True)
+    def local_time_zone(self, monkeypatch):
+        monkeypatch.setenv('TZ', 'America/Chicago')
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    #  Should convert an array of numpy datetime64 values to milliseconds since epoch at local midnight
+    def test_convert_numpy_datetimes(self):
+        # Arrange
+        numpy_datetimes = np.array(['2022-01-01', '1970-01-02'], dtype='datetime64[ns]')
+
+        # Act
+        result = numpy_datetime64_to_milliseconds(numpy_datetimes)
+
+        # Assert
+        assert result.dtype == np.int64
+        assert result.tolist() == [1641016800000, 108000000]
+
+    #  Should match local midnight of each date of a pandas date column, across a daylight saving time change
+    def test_convert_pandas_date_column(self):
+        # Arrange
+        dates = ['2020-01-01 00:00', '2020-01-31 12:30', '2024-07-04 00:00', '2020-01-01 00:00']
+        df = pd.DataFrame({'date': pd.to_datetime(dates)})
+
+        # Act
+        result = numpy_datetime64_to_milliseconds(df.date.values)
+
+        # Assert
+        assert result.tolist() == [QDateTime(numpy_datetime64_to_qdate(date), QTime()).toMSecsSinceEpoch()
+                                   for date in df.date.values]
+
+    #  Should return an empty array for an empty input
+    def test_empty_input(self):
+        # Arrange
+        numpy_datetimes = np.array([], dtype='datetime64[ns]')
+
+        # Act
+        result = numpy_datetime64_to_milliseconds(numpy_datetimes)
+
+        # Assert
+        assert result.dtype == np.int64
+        assert result.size == 0
+
 
 class TestPandasDateToQdate:
 
@@ -0,0 +1,75 @@
+from PySide6.QtCore import QDate, Qt
+from jsdview import CopyableTableView, _tab_delimited_text
+import csv
+import io
+import pytest
+
+
+def csv_writer_text(cells, column_count):
+    stream = io.StringIO()
+    csv.writer(stream, delimiter='\t').writerows(cells[r:r + column_count] for r in range(0, len(cells), column_count))
+    return stream.getvalue()
+
+
+class TestTabDelimitedText:
+
+    #  Should give the same text as csv.writer for tables with and without cells that need quoting
+    @pytest.mark.parametrize('cells, column_count', [
+        (['2020-01-01', '0.5', '2020-02-01', '0.25'], 2),
+        (['2020-01-01', '', '', '0.25'], 2),
+        (['', '', '', ''], 2),
+        (['2020-01-01', '0.5'], 1),
+        (['2020-01-01', ''], 1),
+        ([''], 1),
+        (['a\tb', 'c'], 2),
+        (['a\nb', 'c'], 2),
+        (['a\rb', 'c'], 2),
+        (['say "hi"', 'c'], 2),
+        (['a b', ' c '], 2),
+    ])
+    def test_matches_csv_writer(self, cells, column_count):
+        # Arrange
+        expected = csv_writer_text(cells, column_count)
+
+        # Act
+        result = _tab_delimited_text(cells, column_count)
+
+        # Assert
+        assert result == expected
+
+    #  Should write an empty cell that is the only cell of its row as an empty quoted field
+    def test_single_column_empty_cell(self):
+        # Arrange
+        cells = ['0.5', '', '']
+
+        # Act
+        result = _tab_delimited_text(cells, 1)
+
+        # Assert
+        assert result == '0.5\r\n""\r\n""\r\n'
+
+
+class TestFormatDates:
+
+    #  Should replace dates with ISO 8601 strings and leave the other values alone
+    def test_format_dates(self):
+        # Arrange
+        table = [QDate(2020, 1, 1), 0.5, None, QDate(1, 2, 3), QDate(2020, 1, 1)]
+
+        # Act
+        CopyableTableView._format_dates(table)
+
+        # Assert
+        assert table == ['2020-01-01', 0.5, None, '0001-02-03', '2020-01-01']
+
+    #  Should give the same strings as QDate.toString(format=Qt.ISODate), including the empty ones
+    def test_matches_qdate_to_string(self):
+        # Arrange
+        dates = [QDate(2020, 1, 1), QDate(9999, 12, 31), QDate(-5, 1, 1), QDate(12000, 3, 4), QDate()]
+        table = list(dates)
+
+        # Act
+        CopyableTableView._format_dates(table)
+
+        # Assert
+        assert table == [date.toString(format=Qt.ISODate) for date in dates]
@@ -0,0 +1,39 @@
+from numerictools import cumulative_percents, _cumulative_percents_kernel
+import numpy as np
+
+
+class TestCumulativePercents:
+
+    #  Should return the cumulative sum of each row as a percentage of the row total
+    def test_cumulative_percents(self):
+        # Arrange
+        counts = np.array([[1, 1, 2], [0, 3, 1]])
+
+        # Act
+        result = cumulative_percents(counts)
+
+        # Assert
+        assert result.dtype == np.float64
+        assert np.allclose(result, [[25.0, 50.0, 100.0], [0.0, 75.0, 100.0]])
+
+    #  Should return zeros for a row with a total of zero
+    def test_zero_total_row(self):
+        # Arrange
+        counts = np.array([[0.0, 0.0], [1.0, 1.0]])
+
+        # Act
+        result = cumulative_percents(counts)
+
+        # Assert
+        assert np.allclose(result, [[0.0, 0.0], [50.0, 100.0]])
+
+    #  Should give the same result as the loop kernel that is compiled with numba
+    def test_matches_kernel(self):
+        # Arrange
+        counts = np.random.default_rng(0).integers(0, 100, size=(20, 7)).astype(np.float64)
+
+        # Act
+        result = cumulative_percents(counts)
+
+        # Assert
+        assert np.allclose(result, _cumulative_percents_kernel(counts))